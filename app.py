@@ -1,174 +1,93 @@
 import streamlit as st
-import random
+import ast
+import json
 
-def is_prime(n, k=5):
-    """
-    Miller-Rabin primality test.
-    Returns True if n is probably prime, False otherwise.
-    """
-    if n <= 1 or n == 4:
-        return False
-    if n <= 3:
-        return True
-    if n % 2 == 0:
-        return False
-
-    # Write n-1 as 2^s * d
-    s = 0
-    d = n - 1
-    while d % 2 == 0:
-        s += 1
-        d //= 2
-
-    # Repeat k times
-    for _ in range(k):
-        a = random.randint(2, n - 2)
-        x = pow(a, d, n)
-        if x == 1 or x == n - 1:
-            continue
-        for _ in range(s - 1):
-            x = pow(x, 2, n)
-            if x == n - 1:
-                break
-        else:
-            return False
-    return True
-
-def generate_prime(bits):
-    """
-    Generates a probable prime number of the given bit length.
-    """
-    while True:
-        p = random.getrandbits(bits)
-        # Ensure the number is odd and within the bit length range
-        p |= (1 << bits - 1) | 1 # Set MSB and LSB to 1
-        if is_prime(p):
-            return p
-
-def gcd(a, b):
-    """
-    Calculates the Greatest Common Divisor (GCD) of a and b using Euclidean algorithm.
-    """
-    while b:
-        a, b = b, a % b
-    return a
+from rsa_core import generate_keypair, powmod, to_bignum
 
-def mod_inverse(a, m):
+def format_int(x):
     """
-    Calculates the modular multiplicative inverse of a modulo m using Extended Euclidean Algorithm.
-    Returns x such that (a * x) % m == 1.
+    Formats a big integer for display.
+    Uses hex (linear-time conversion) unless decimal display is enabled in the sidebar.
     """
-    m0 = m
-    y = 0
-    x = 1
-    if m == 1:
-        return 0
-    while a > 1:
-        q = a // m
-        t = m
-        m = a % m
-        a = t
-        t = y
-        y = x - q * y
-        x = t
-    if x < 0:
-        x = x + m0
-    return x
+    if st.session_state.get("show_decimal", False):
+        return str(x)
+    return f"{x:#x}"
 
-def generate_keypair(bits=1024):
+def block_size(n):
     """
-    Generates an RSA public and private key pair.
-    Returns ((n, e), (n, d)).
+    Returns the number of plaintext bytes packed into one RSA block.
+    Every block value stays below n because it has at most n.bit_length() - 1 bits.
     """
-    st.info(f"Step 1: Generating two large prime numbers (p and q) of {bits // 2} bits each...")
-
-    p = generate_prime(bits // 2)
-    q = generate_prime(bits // 2)
-    while p == q:
-        q = generate_prime(bits // 2)
-
-    n = p * q
-    phi = (p - 1) * (q - 1)
-
-    # Tampilkan p dan q tanpa backtick agar tidak "kotak-kotak"
-    st.success("Generated Prime Numbers:")
-    st.code(f"p = {p}\nq = {q}", language="text")
-
-    # Expander untuk melihat nilai lengkap (lebih rapi)
-    with st.expander("View Prime Numbers (p and q)", expanded=False):
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown("**Prime p:**")
-            st.code(str(p), language="text")
-        with col2:
-            st.markdown("**Prime q:**")
-            st.code(str(q), language="text")
-
-    st.info(f"Step 2: Calculate n = p × q =\n{n}")
-    st.info(f"Step 3: Calculate Euler's totient φ(n) = (p-1)×(q-1) =\n{phi}")
-
-    # Pilih e
-    st.info("Step 4: Choose public exponent (e) such that 1 < e < φ(n) and gcd(e, φ(n)) = 1")
-    e = 65537  # Lebih cepat dan aman (umum digunakan)
-    while gcd(e, phi) != 1:
-        e = random.randint(2, phi - 1)
-
-    st.info("Step 5: Calculate private exponent (d) as the modular multiplicative inverse of e modulo φ(n)")
-    d = mod_inverse(e, phi)
-
-    # Tampilkan e dan d tanpa backtick juga
-    st.success(f"Key Parameters Generated:\nPublic exponent (e) = {e}\nPrivate exponent (d) = {d}")
-
-    with st.expander("View Full Key Parameters", expanded=False):
-        st.markdown("**Public exponent (e):**")
-        st.code(str(e), language="text")
-        st.markdown("**Private exponent (d):**")
-        st.code(str(d), language="text")
-        st.markdown("**Modulus (n):**")
-        st.code(str(n), language="text")
-
-    return ((n, e), (n, d))
+    return (n.bit_length() - 1) // 8
 
 def encrypt(public_key, plaintext):
     """
     Encrypts the plaintext using the public key.
-    Converts string to integers, encrypts each, returns list of integers.
-    Note: This is a simplified character-by-character encryption for demonstration.
-          In real RSA, entire messages/blocks are converted to numbers and padded.
+    The UTF-8 bytes of the message are split into blocks of block_size(n)
+    bytes, each block is read as a big-endian integer and encrypted.
+    Returns list of integers (one per block).
+    Note: This is a simplified encryption for demonstration.
+          In real RSA, message blocks are padded (e.g., OAEP) before encryption.
     """
     n, e = public_key
+    n_big, e_big = to_bignum(n), to_bignum(e)
 
-    encrypted_msg_chars = []
+    data = plaintext.encode("utf-8")
+    block_bytes = block_size(n)
 
-    for char in plaintext:
-        char_as_int = ord(char)
-        # Check if character's ASCII value is too large for the key's 'n' value
-        # This check is mostly for conceptual understanding in this simple demo,
-        # as 'n' will usually be much larger than any char value in real RSA.
-        if char_as_int >= n:
-            st.error(f"❌ **Error:** Character '{char}' (ASCII: {char_as_int}) is too large for the current key (n={n})."
-                     " This simplified demo requires `ord(char) < n`. Please consider a larger key size"
-                     " or a simpler message (e.g., ASCII characters).")
-            return [] # Indicate error
+    return [int(powmod(int.from_bytes(data[i:i + block_bytes], "big"), e_big, n_big))
+            for i in range(0, len(data), block_bytes)]
 
-        encrypted_char = pow(char_as_int, e, n)
-        encrypted_msg_chars.append(encrypted_char)
+def blocks_to_text(blocks, block_bytes, msg_len=None):
+    """
+    Converts decrypted block integers back to a string.
+    All blocks except the last are exactly block_bytes long; the last block
+    holds the remaining msg_len bytes, or its minimal length if msg_len is unknown.
+    """
+    if not blocks:
+        return ""
+    *full_blocks, last_block = blocks
+    if msg_len is None:
+        last_len = (last_block.bit_length() + 7) // 8
+    else:
+        last_len = msg_len - block_bytes * len(full_blocks)
 
-    return encrypted_msg_chars
+    out = bytearray()
+    for m in full_blocks:
+        out += int(m).to_bytes(block_bytes, "big")
+    out += int(last_block).to_bytes(last_len, "big")
+    return out.decode("utf-8", errors="replace")
 
-def decrypt(private_key, ciphertext):
+def decrypt(private_key, ciphertext, msg_len=None):
     """
     Decrypts the ciphertext using the private key.
-    Converts list of integers back to string.
+    Converts list of block integers back to string; msg_len is the byte
+    length of the original message, if known.
     """
     n, d = private_key
+    n_big, d_big = to_bignum(n), to_bignum(d)
 
-    decrypted_chars = []
-    for char_code in ciphertext:
-        decrypted_char_int = pow(char_code, d, n)
-        decrypted_chars.append(chr(decrypted_char_int))
+    blocks = [powmod(c, d_big, n_big) for c in ciphertext]
+    return blocks_to_text(blocks, block_size(n), msg_len)
 
-    return "".join(decrypted_chars)
+def decrypt_crt(private_key_crt, ciphertext, msg_len=None):
+    """
+    Decrypts the ciphertext using the CRT form of the private key.
+    Two half-size exponentiations modulo p and q replace one full-size
+    exponentiation modulo n; the result is the same as decrypt().
+    """
+    p, q, dP, dQ, qInv = private_key_crt
+    p_big, q_big = to_bignum(p), to_bignum(q)
+    dP_big, dQ_big = to_bignum(dP), to_bignum(dQ)
+
+    def _decrypt_one(c):
+        m1 = powmod(c, dP_big, p_big)
+        m2 = powmod(c, dQ_big, q_big)
+        h = (qInv * (m1 - m2)) % p
+        return m2 + h * q
+
+    blocks = [_decrypt_one(c) for c in ciphertext]
+    return blocks_to_text(blocks, block_size(p * q), msg_len)
 
 # --- Custom CSS for Professional Styling ---
 def load_custom_css():
@@ -412,8 +331,15 @@ if 'public_key' not in st.session_state:
     st.session_state.public_key = None
 if 'private_key' not in st.session_state:
     st.session_state.private_key = None
+if 'private_key_crt' not in st.session_state:
+    st.session_state.private_key_crt = None
+if 'keypair_cache' not in st.session_state:
+    # Key pair terakhir per ukuran kunci, hanya untuk sesi ini
+    st.session_state.keypair_cache = {}
 if 'encrypted_msg' not in st.session_state:
     st.session_state.encrypted_msg = []
+if 'encrypted_len' not in st.session_state:
+    st.session_state.encrypted_len = None
 if 'original_msg' not in st.session_state:
     st.session_state.original_msg = ""
 if 'decrypted_msg' not in st.session_state:
@@ -428,6 +354,13 @@ page = st.sidebar.radio(
     label_visibility="collapsed"
 )
 
+# Tampilan angka besar: hex secara default, desimal hanya jika diminta
+st.sidebar.checkbox(
+    "🔢 Show numbers in decimal",
+    key="show_decimal",
+    help="Large numbers are shown in hexadecimal by default, which renders faster for big keys"
+)
+
 # Sidebar info
 st.sidebar.markdown("---")
 st.sidebar.markdown("### 📚 About RSA")
@@ -491,18 +424,65 @@ if page == "🔑 Key Generation":
     # Generate button
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        if st.button("🚀 Generate RSA Key Pair", type="primary", use_container_width=True):
+        generate_clicked = st.button("🚀 Generate RSA Key Pair", type="primary", use_container_width=True)
+        regenerate_clicked = st.button(
+            "🔁 Regenerate Fresh Keys",
+            use_container_width=True,
+            help="Replace the saved key pair for this key size with one built from new primes"
+        )
+        if generate_clicked or regenerate_clicked:
             with st.spinner("🔄 Generating cryptographic keys..."):
-                progress_bar = st.progress(0)
-                for i in range(100):
-                    progress_bar.progress(i + 1)
-                
-                public, private = generate_keypair(key_bits)
-                st.session_state.public_key = public
-                st.session_state.private_key = private
-                
-                st.balloons()
-                st.success("✅ Keys generated successfully!")
+                # Generate memakai key pair terakhir untuk ukuran ini; Regenerate selalu membuat ulang
+                keys = st.session_state.keypair_cache.get(key_bits)
+                if keys is None or regenerate_clicked:
+                    keys = generate_keypair(key_bits)
+                    st.session_state.keypair_cache[key_bits] = keys
+                if keys.public != st.session_state.public_key:
+                    # Ciphertext lama dibuat dengan kunci sebelumnya
+                    st.session_state.encrypted_msg = []
+                    st.session_state.encrypted_len = None
+                st.session_state.public_key = keys.public
+                st.session_state.private_key = keys.private
+                st.session_state.private_key_crt = keys.private_crt
+            
+            # Tampilkan langkah-langkah setelah semua perhitungan selesai
+            st.info(f"Step 1: Generate two large prime numbers (p and q) of {key_bits // 2} bits each")
+            
+            # Tampilkan p dan q tanpa backtick agar tidak "kotak-kotak"
+            st.success("Generated Prime Numbers:")
+            p_text, q_text = format_int(keys.p), format_int(keys.q)
+            st.code(f"p = {p_text}\nq = {q_text}", language="text")
+            
+            # Expander untuk melihat nilai lengkap (lebih rapi)
+            with st.expander("View Prime Numbers (p and q)", expanded=False):
+                col_p, col_q = st.columns(2)
+                with col_p:
+                    st.markdown("**Prime p:**")
+                    st.code(p_text, language="text")
+                with col_q:
+                    st.markdown("**Prime q:**")
+                    st.code(q_text, language="text")
+            
+            n_text = format_int(keys.n)
+            st.info(f"Step 2: Calculate n = p × q =\n{n_text}")
+            st.info(f"Step 3: Calculate Euler's totient φ(n) = (p-1)×(q-1) =\n{format_int(keys.phi)}")
+            st.info("Step 4: Choose public exponent (e) such that 1 < e < φ(n) and gcd(e, φ(n)) = 1")
+            st.info("Step 5: Calculate private exponent (d) as the modular multiplicative inverse of e modulo φ(n)")
+            
+            # Tampilkan e dan d tanpa backtick juga
+            e_text, d_text = format_int(keys.e), format_int(keys.d)
+            st.success(f"Key Parameters Generated:\nPublic exponent (e) = {e_text}\nPrivate exponent (d) = {d_text}")
+            
+            with st.expander("View Full Key Parameters", expanded=False):
+                st.markdown("**Public exponent (e):**")
+                st.code(e_text, language="text")
+                st.markdown("**Private exponent (d):**")
+                st.code(d_text, language="text")
+                st.markdown("**Modulus (n):**")
+                st.code(n_text, language="text")
+            
+            st.balloons()
+            st.success("✅ Keys generated successfully!")
     
     # Display generated keys
     if st.session_state.public_key and st.session_state.private_key:
@@ -523,11 +503,11 @@ if page == "🔑 Key Generation":
             
             with st.expander("📋 View Public Key Details", expanded=True):
                 st.markdown("**Modulus (n):**")
-                st.text_area("n", str(n_pub), height=100, label_visibility="collapsed", key="pub_n")
+                st.text_area("n", format_int(n_pub), height=100, label_visibility="collapsed", key="pub_n")
                 st.markdown("**Public Exponent (e):**")
-                st.text_area("e", str(e_pub), height=60, label_visibility="collapsed", key="pub_e")
+                st.text_area("e", format_int(e_pub), height=60, label_visibility="collapsed", key="pub_e")
             
-            st.metric("Modulus Length", f"{len(str(n_pub))} digits")
+            st.metric("Modulus Length", f"{n_pub.bit_length()} bits")
         
         with col2:
             st.markdown("##### 🔒 Private Key (Keep Secret)")
@@ -541,9 +521,9 @@ if page == "🔑 Key Generation":
             
             with st.expander("📋 View Private Key Details", expanded=True):
                 st.markdown("**Modulus (n):**")
-                st.text_area("n", str(n_priv), height=100, label_visibility="collapsed", key="priv_n")
+                st.text_area("n", format_int(n_priv), height=100, label_visibility="collapsed", key="priv_n")
                 st.markdown("**Private Exponent (d):**")
-                st.text_area("d", str(d_priv), height=100, label_visibility="collapsed", key="priv_d")
+                st.text_area("d", format_int(d_priv), height=100, label_visibility="collapsed", key="priv_d")
             
             st.warning("🚨 **Security Warning:** Keep your private key confidential at all times!")
 
@@ -562,7 +542,7 @@ elif page == "🔒 Encryption":
                 <div class="metric-label">Public Modulus (n)</div>
                 <div class="metric-value">{}</div>
             </div>
-            """.format(str(n_pub)[:20] + "..."), unsafe_allow_html=True)
+            """.format(format_int(n_pub)[:20] + "..."), unsafe_allow_html=True)
         
         with col2:
             st.markdown("""
@@ -578,7 +558,7 @@ elif page == "🔒 Encryption":
                 <div class="metric-label">Key Size</div>
                 <div class="metric-value">{} bits</div>
             </div>
-            """.format(len(bin(n_pub)) - 2), unsafe_allow_html=True)
+            """.format(n_pub.bit_length()), unsafe_allow_html=True)
         
         st.markdown("---")
         
@@ -607,6 +587,7 @@ elif page == "🔒 Encryption":
                         encrypted_data = encrypt(st.session_state.public_key, message_to_encrypt)
                         if encrypted_data:
                             st.session_state.encrypted_msg = encrypted_data
+                            st.session_state.encrypted_len = len(message_to_encrypt.encode("utf-8"))
                             st.success("✅ Message encrypted successfully!")
                             
                             st.markdown("---")
@@ -618,16 +599,18 @@ elif page == "🔒 Encryption":
                             with col2:
                                 st.metric("Encrypted Blocks", len(encrypted_data))
                             
-                            st.info("💡 Each number represents an encrypted character. "
+                            block_bytes = block_size(n_pub)
+                            st.info(f"💡 Each number represents an encrypted block of up to {block_bytes} bytes of the message. "
                                    "This ciphertext can only be decrypted with the corresponding private key.")
                             
                             with st.expander("🔍 View Encryption Details"):
                                 st.markdown("**Original Message:**")
                                 st.text(message_to_encrypt)
                                 st.markdown("**Encrypted Values (first 5):**")
+                                message_bytes = message_to_encrypt.encode("utf-8")
                                 for i, val in enumerate(encrypted_data[:5]):
-                                    char = message_to_encrypt[i]
-                                    st.text(f"'{char}' (ASCII {ord(char)}) → {val}")
+                                    chunk = message_bytes[i * block_bytes:(i + 1) * block_bytes]
+                                    st.text(f"Block {i + 1} ({len(chunk)} bytes) {chunk!r} → {val}")
                         else:
                             st.error("❌ Encryption failed. Please check the error message above.")
     else:
@@ -657,7 +640,7 @@ elif page == "🔓 Decryption & Verification":
                 <div class="metric-label">Private Modulus (n)</div>
                 <div class="metric-value">{}</div>
             </div>
-            """.format(str(n_priv)[:20] + "..."), unsafe_allow_html=True)
+            """.format(format_int(n_priv)[:20] + "..."), unsafe_allow_html=True)
         
         with col2:
             st.markdown("""
@@ -665,7 +648,7 @@ elif page == "🔓 Decryption & Verification":
                 <div class="metric-label">Private Exponent (d)</div>
                 <div class="metric-value">{}</div>
             </div>
-            """.format(str(d_priv)[:20] + "..."), unsafe_allow_html=True)
+            """.format(format_int(d_priv)[:20] + "..."), unsafe_allow_html=True)
         
         with col3:
             encrypted_count = len(st.session_state.encrypted_msg) if st.session_state.encrypted_msg else 0
@@ -688,11 +671,14 @@ elif page == "🔓 Decryption & Verification":
             horizontal=True
         )
         
+        # Panjang pesan (byte) hanya diketahui untuk ciphertext hasil enkripsi terakhir
+        ciphertext_len = None
         if decrypt_option == "Use Last Encrypted Message":
             if st.session_state.encrypted_msg:
                 with st.expander("📋 View Encrypted Data", expanded=True):
                     st.code(str(st.session_state.encrypted_msg), language="python")
                 ciphertext_to_decrypt = st.session_state.encrypted_msg
+                ciphertext_len = st.session_state.encrypted_len
             else:
                 st.warning("⚠️ No encrypted message available. Please encrypt a message first or use manual input.")
                 ciphertext_to_decrypt = []
@@ -706,11 +692,20 @@ elif page == "🔓 Decryption & Verification":
             )
             try:
                 if manual_cipher.strip():
-                    ciphertext_to_decrypt = eval(manual_cipher)
+                    try:
+                        ciphertext_to_decrypt = json.loads(manual_cipher)
+                    except ValueError:
+                        # Terima juga literal Python (mis. tuple atau angka hex)
+                        ciphertext_to_decrypt = ast.literal_eval(manual_cipher)
+                    if not isinstance(ciphertext_to_decrypt, (list, tuple)) or not all(
+                            isinstance(c, int) and not isinstance(c, bool) and c >= 0
+                            for c in ciphertext_to_decrypt):
+                        raise ValueError("ciphertext must be a list of non-negative integers")
+                    ciphertext_to_decrypt = list(ciphertext_to_decrypt)
                     st.success(f"✓ Valid ciphertext with {len(ciphertext_to_decrypt)} encrypted blocks")
                 else:
                     ciphertext_to_decrypt = []
-            except:
+            except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
                 st.error("❌ Invalid format. Please enter a valid Python list of integers.")
                 ciphertext_to_decrypt = []
         
@@ -724,77 +719,83 @@ elif page == "🔓 Decryption & Verification":
                     st.error("🚫 No message to decrypt. Please encrypt a message first or input ciphertext manually.")
                 else:
                     with st.spinner("🔄 Decrypting your message..."):
-                        progress_bar = st.progress(0)
-                        for i in range(100):
-                            progress_bar.progress(i + 1)
-                        
-                        decrypted_message = decrypt(st.session_state.private_key, ciphertext_to_decrypt)
-                        st.session_state.decrypted_msg = decrypted_message
-                        st.success("✅ Message decrypted successfully!")
-                        
-                        st.markdown("---")
-                        st.markdown("#### 📜 Decrypted Message")
-                        st.markdown("""
-                        <div class="success-box">
-                        <h4>Decrypted Plaintext:</h4>
-                        <p style="font-size: 1.1rem; font-weight: 500;">{}</p>
-                        </div>
-                        """.format(decrypted_message), unsafe_allow_html=True)
-                        
-                        # Verification section
-                        st.markdown("---")
-                        st.markdown("#### ✅ Verification Process")
-                        
-                        if st.session_state.original_msg == st.session_state.decrypted_msg:
+                        try:
+                            if st.session_state.private_key_crt:
+                                decrypted_message = decrypt_crt(st.session_state.private_key_crt, ciphertext_to_decrypt, ciphertext_len)
+                            else:
+                                # Tanpa parameter CRT, dekripsi langsung dengan (n, d)
+                                decrypted_message = decrypt(st.session_state.private_key, ciphertext_to_decrypt, ciphertext_len)
+                        except (OverflowError, ValueError):
+                            # Ciphertext tidak cocok dengan kunci saat ini (mis. input manual atau kunci baru)
+                            st.error("❌ This ciphertext cannot be decrypted with the current private key. "
+                                     "Please check the input or re-encrypt the message with the current key.")
+                        else:
+                            st.session_state.decrypted_msg = decrypted_message
+                            st.success("✅ Message decrypted successfully!")
+                            
+                            st.markdown("---")
+                            st.markdown("#### 📜 Decrypted Message")
                             st.markdown("""
                             <div class="success-box">
-                            <h3>🎉 Verification Successful!</h3>
-                            <p><strong>Result:</strong> The decrypted message matches the original message perfectly.</p>
-                            <p><strong>Status:</strong> ✓ Encryption and decryption process completed successfully.</p>
+                            <h4>Decrypted Plaintext:</h4>
+                            <p style="font-size: 1.1rem; font-weight: 500;">{}</p>
                             </div>
-                            """, unsafe_allow_html=True)
+                            """.format(decrypted_message), unsafe_allow_html=True)
                             
-                            col1, col2 = st.columns(2)
-                            with col1:
-                                st.metric("Original Length", f"{len(st.session_state.original_msg)} chars", delta="Match")
-                            with col2:
-                                st.metric("Decrypted Length", f"{len(st.session_state.decrypted_msg)} chars", delta="Match")
-                            
-                        else:
-                            st.markdown("""
-                            <div class="warning-box">
-                            <h3>❌ Verification Failed!</h3>
-                            <p><strong>Result:</strong> The decrypted message does NOT match the original message.</p>
-                            </div>
-                            """, unsafe_allow_html=True)
+                            # Verification section
+                            st.markdown("---")
+                            st.markdown("#### ✅ Verification Process")
                             
-                            col1, col2 = st.columns(2)
-                            with col1:
-                                st.markdown("**Original Message:**")
-                                st.code(st.session_state.original_msg)
-                            with col2:
-                                st.markdown("**Decrypted Message:**")
-                                st.code(st.session_state.decrypted_msg)
-                        
-                        # Detailed comparison
-                        with st.expander("🔍 View Detailed Comparison"):
-                            st.markdown("**Character-by-Character Comparison:**")
-                            comparison_df_data = []
-                            for i in range(min(len(st.session_state.original_msg), len(st.session_state.decrypted_msg))):
-                                orig_char = st.session_state.original_msg[i]
-                                dec_char = st.session_state.decrypted_msg[i]
-                                match = "✓" if orig_char == dec_char else "✗"
-                                comparison_df_data.append({
-                                    "Position": i + 1,
-                                    "Original": orig_char,
-                                    "Decrypted": dec_char,
-                                    "Match": match
-                                })
+                            if st.session_state.original_msg == st.session_state.decrypted_msg:
+                                st.markdown("""
+                                <div class="success-box">
+                                <h3>🎉 Verification Successful!</h3>
+                                <p><strong>Result:</strong> The decrypted message matches the original message perfectly.</p>
+                                <p><strong>Status:</strong> ✓ Encryption and decryption process completed successfully.</p>
+                                </div>
+                                """, unsafe_allow_html=True)
+                                
+                                col1, col2 = st.columns(2)
+                                with col1:
+                                    st.metric("Original Length", f"{len(st.session_state.original_msg)} chars", delta="Match")
+                                with col2:
+                                    st.metric("Decrypted Length", f"{len(st.session_state.decrypted_msg)} chars", delta="Match")
+                                
+                            else:
+                                st.markdown("""
+                                <div class="warning-box">
+                                <h3>❌ Verification Failed!</h3>
+                                <p><strong>Result:</strong> The decrypted message does NOT match the original message.</p>
+                                </div>
+                                """, unsafe_allow_html=True)
+                                
+                                col1, col2 = st.columns(2)
+                                with col1:
+                                    st.markdown("**Original Message:**")
+                                    st.code(st.session_state.original_msg)
+                                with col2:
+                                    st.markdown("**Decrypted Message:**")
+                                    st.code(st.session_state.decrypted_msg)
                             
-                            if comparison_df_data:
-                                st.dataframe(comparison_df_data[:20], use_container_width=True)
-                                if len(comparison_df_data) > 20:
-                                    st.caption(f"Showing first 20 of {len(comparison_df_data)} characters")
+                            # Detailed comparison
+                            with st.expander("🔍 View Detailed Comparison"):
+                                st.markdown("**Character-by-Character Comparison:**")
+                                comparison_df_data = []
+                                for i in range(min(len(st.session_state.original_msg), len(st.session_state.decrypted_msg))):
+                                    orig_char = st.session_state.original_msg[i]
+                                    dec_char = st.session_state.decrypted_msg[i]
+                                    match = "✓" if orig_char == dec_char else "✗"
+                                    comparison_df_data.append({
+                                        "Position": i + 1,
+                                        "Original": orig_char,
+                                        "Decrypted": dec_char,
+                                        "Match": match
+                                    })
+                                
+                                if comparison_df_data:
+                                    st.dataframe(comparison_df_data[:20], use_container_width=True)
+                                    if len(comparison_df_data) > 20:
+                                        st.caption(f"Showing first 20 of {len(comparison_df_data)} characters")
     else:
         st.markdown("""
         <div class="info-card">
@@ -819,7 +820,7 @@ st.markdown("""
     and typically encrypt symmetric keys (which then encrypt the message) rather than raw messages directly.
     </p>
     <p style="color: #666; margin-top: 1rem;">
-    Character-by-character encryption as demonstrated here is inefficient and has security limitations.
+    Splitting the message into unpadded blocks as demonstrated here is deterministic and has security limitations.
     </p>
     <p style="margin-top: 1.5rem; color: #888; font-size: 0.9rem;">
     🔐 Built with Streamlit | RSA Cryptography Educational Suite
@@ -0,0 +1,256 @@
+"""
+Number theory helpers for the RSA dashboard: primality testing, prime
+generation, modular inverse and key pair generation.
+Kept free of Streamlit so the functions can run in worker processes.
+"""
+import math
+import multiprocessing
+import os
+import secrets
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+
+try:
+    import gmpy2
+except ImportError:  # gmpy2 opsional, pakai pow bawaan Python jika tidak ada
+    gmpy2 = None
+
+# Modular exponentiation via GMP when available, CPython's pow otherwise
+powmod = gmpy2.powmod if gmpy2 else pow
+to_bignum = gmpy2.mpz if gmpy2 else int
+
+def _sieve_small_primes(limit):
+    """
+    Sieve of Eratosthenes.
+    Returns the odd primes below limit (2 is skipped, candidates are always odd).
+    """
+    sieve = bytearray([1]) * limit
+    sieve[0:2] = b"\x00\x00"
+    for i in range(2, int(limit ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytes(len(range(i * i, limit, i)))
+    return [i for i in range(3, limit) if sieve[i]]
+
+# Dipakai untuk menyaring kandidat prima sebelum Miller-Rabin
+SMALL_PRIMES = _sieve_small_primes(2000)
+SMALL_PROD = math.prod(SMALL_PRIMES)
+
+# Witness deterministik: hasil Miller-Rabin pasti benar untuk n < 2^64
+MR_BASES_64 = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+
+def _is_strong_probable_prime(a, d, s, n, n_minus_1):
+    """
+    One Miller-Rabin round: checks whether n (with n-1 = 2^s * d) is a
+    strong probable prime to base a.
+    """
+    x = powmod(a, d, n)
+    if x == 1 or x == n_minus_1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n_minus_1:
+            return True
+    return False
+
+def is_prime(n, k=5):
+    """
+    Miller-Rabin primality test.
+    A strong base-2 test runs first; only candidates that pass it go through
+    the remaining witnesses. For n < 2^64 a fixed witness set makes the answer
+    exact; for larger n the first k primes are used as witnesses.
+    Returns True if n is probably prime, False otherwise.
+    """
+    if n <= 1 or n == 4:
+        return False
+    if n <= 3:
+        return True
+    if n % 2 == 0:
+        return False
+
+    # Write n-1 as 2^s * d (s = index of the lowest set bit of n-1)
+    n_minus_1 = n - 1
+    s = (n_minus_1 & -n_minus_1).bit_length() - 1
+    d = n_minus_1 >> s
+
+    n_big = to_bignum(n)
+    d_big = to_bignum(d)
+
+    # Hampir semua bilangan komposit sudah gagal di basis 2
+    if not _is_strong_probable_prime(2, d_big, s, n_big, n_minus_1):
+        return False
+
+    if n.bit_length() <= 64:
+        bases = MR_BASES_64[1:]
+    else:
+        bases = SMALL_PRIMES[:k - 1]
+
+    for a in bases:
+        a %= n
+        if a == 0:
+            continue
+        if not _is_strong_probable_prime(a, d_big, s, n_big, n_minus_1):
+            return False
+    return True
+
+def random_candidates(bits, count=64):
+    """
+    Yields random odd numbers of exactly the given bit length.
+    Entropy is drawn from os.urandom for count candidates at a time, so the
+    candidate loop makes one syscall per count numbers.
+    """
+    nbytes = (bits + 7) // 8
+    mask = (1 << bits) - 1
+    top = (1 << bits - 1) | 1 # Set MSB and LSB to 1
+    while True:
+        pool = os.urandom(nbytes * count)
+        for i in range(0, len(pool), nbytes):
+            yield (int.from_bytes(pool[i:i + nbytes], "big") & mask) | top
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def _pool_context():
+    """
+    Returns the multiprocessing context for the worker pool: forkserver
+    where the platform supports it, spawn otherwise.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+def _get_executor():
+    """
+    Returns the process pool shared by all batched prime searches.
+    Workers are started once, so repeated key generation skips the pool start-up.
+    Each worker re-imports the parent's __main__ module, so a calling script
+    needs an `if __name__ == "__main__":` guard (the Streamlit launcher has one).
+    They come from a forkserver (or spawn where forkserver is unavailable, e.g.
+    Windows) rather than a fork of the (multi-threaded) Streamlit server.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(mp_context=_pool_context())
+        return _executor
+
+def _reset_executor(broken):
+    """
+    Drops the shared pool after one of its workers died, so the next call
+    to _get_executor starts a fresh one.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is broken:
+            _executor = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+def generate_primes_batch(bits, count, batch=None):
+    """
+    Generates count distinct probable primes of the given bit length.
+    All searches share one stream of sieved candidate batches, tested in
+    parallel across processes, so the primes are found concurrently.
+    Returns a list of primes in the order they were found.
+    Scripts calling this outside Streamlit need an `if __name__ == "__main__":`
+    guard, since the worker processes re-run the main module.
+    """
+    if batch is None:
+        batch = (os.cpu_count() or 1) * 2
+
+    executor = _get_executor()
+    try:
+        return _search_primes(executor, bits, count, batch)
+    except BrokenProcessPool:
+        # Worker mati (mis. OOM): ganti pool lalu coba sekali lagi
+        _reset_executor(executor)
+        return _search_primes(_get_executor(), bits, count, batch)
+
+def _search_primes(executor, bits, count, batch):
+    """
+    Runs the batched candidate search for generate_primes_batch on the given pool.
+    """
+    source = random_candidates(bits)
+    primes = []
+    while True:
+        candidates = []
+        while len(candidates) < batch:
+            p = next(source)
+            # One gcd against the product of small primes rejects most composites
+            # before any expensive modular exponentiation is done
+            if p > SMALL_PRIMES[-1] and math.gcd(p, SMALL_PROD) != 1:
+                continue
+            candidates.append(p)
+
+        futures = {executor.submit(is_prime, p): p for p in candidates}
+        for future in as_completed(futures):
+            p = futures[future]
+            if future.result() and p not in primes:
+                primes.append(p)
+                if len(primes) == count:
+                    # Sisa kandidat tidak perlu diuji lagi
+                    for f in futures:
+                        f.cancel()
+                    return primes
+
+def mod_inverse(a, m):
+    """
+    Calculates the modular multiplicative inverse of a modulo m.
+    The extended Euclidean algorithm runs in C via pow(a, -1, m).
+    Returns x such that (a * x) % m == 1.
+    """
+    return pow(a, -1, m)
+
+@dataclass(frozen=True)
+class KeyGenResult:
+    """
+    All values produced while generating an RSA key pair.
+    dP, dQ and qInv are the CRT parameters used for faster decryption.
+    """
+    p: int
+    q: int
+    n: int
+    phi: int
+    e: int
+    d: int
+    dP: int
+    dQ: int
+    qInv: int
+
+    @property
+    def public(self):
+        return (self.n, self.e)
+
+    @property
+    def private(self):
+        return (self.n, self.d)
+
+    @property
+    def private_crt(self):
+        return (self.p, self.q, self.dP, self.dQ, self.qInv)
+
+def generate_keypair(bits=1024):
+    """
+    Generates an RSA public and private key pair.
+    Returns a KeyGenResult; public is (n, e), private is (n, d).
+    Prime search runs in worker processes, see generate_primes_batch.
+    """
+    # p dan q dicari bersamaan dan dijamin berbeda
+    p, q = generate_primes_batch(bits // 2, 2)
+
+    n = p * q
+    phi = (p - 1) * (q - 1)
+
+    # Pilih e
+    e = 65537  # Lebih cepat dan aman (umum digunakan)
+    while math.gcd(e, phi) != 1:
+        e = 2 + secrets.randbelow(phi - 2) # 2 <= e < φ(n)
+
+    d = mod_inverse(e, phi)
+
+    # Parameter CRT untuk dekripsi yang lebih cepat
+    dP = d % (p - 1)
+    dQ = d % (q - 1)
+    qInv = mod_inverse(q, p)
+
+    return KeyGenResult(p, q, n, phi, e, d, dP, dQ, qInv)